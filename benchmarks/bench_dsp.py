@@ -0,0 +1,224 @@
+"""
+Headless DSP benchmarks.
+
+Renders blocks through VoiceManager.process, Looper.process and the full
+AudioEngine._callback (no audio device is opened) and reports per-block
+latency (p50 / p99 / max, in microseconds) and real-time factor
+(block duration / mean render time; > 1.0 means faster than real time).
+
+Each sweep varies one axis around a default configuration:
+    voices, waveform, block size, active looper pods, filter mode.
+
+Usage:
+    python benchmarks/bench_dsp.py                          # run and print
+    python benchmarks/bench_dsp.py --save baseline.json     # store a baseline
+    python benchmarks/bench_dsp.py --compare baseline.json  # fail on regressions
+"""
+import sys
+import os
+import time
+import json
+import argparse
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from audio.voice_manager import VoiceManager
+from audio.looper import Looper, PodState
+
+try:
+    from audio.engine import AudioEngine
+    ENGINE_ERROR = None
+except (ImportError, OSError) as e:
+    # sounddevice needs PortAudio even though no stream is opened here
+    AudioEngine = None
+    ENGINE_ERROR = e
+
+SAMPLE_RATE = 44100
+
+DEFAULTS = {
+    'voices': 8,
+    'waveform': 'saw',
+    'block': 1024,
+    'pods': 0,
+    'filter': 'butter',
+}
+
+SWEEPS = {
+    'voices': [1, 4, 8, 16, 32],
+    'waveform': ['sine', 'saw', 'square', 'triangle'],
+    'block': [128, 256, 512, 1024, 2048],
+    'pods': [0, 1, 5, 10],
+    'filter': ['butter', 'cheby'],
+}
+
+# Resonance > 1.0 switches the filter design to Chebyshev (see filter.design_coefficients)
+FILTER_RESONANCE = {'butter': 0.7, 'cheby': 2.0}
+
+def _note_freqs(count):
+    return [110.0 * 2 ** (i * 5 / 12.0) for i in range(count)]
+
+def _setup_voice_manager(vm, config):
+    vm.set_param('osc_type', config['waveform'])
+    vm.set_param('resonance', FILTER_RESONANCE[config['filter']])
+    vm.set_param('release', 5.0)
+    for freq in _note_freqs(config['voices']):
+        vm.note_on(freq)
+
+def _setup_looper(looper, config):
+    rng = np.random.default_rng(0)
+    for pod in looper.pods[:config['pods']]:
+        pod.buffer = rng.uniform(-0.5, 0.5, SAMPLE_RATE * 2)
+        pod.play_head = 0
+        pod.state = PodState.PLAYING
+
+def make_voice_manager_case(config):
+    vm = VoiceManager(SAMPLE_RATE, max_voices=max(8, config['voices']))
+    vm.prepare(config['block'])
+    _setup_voice_manager(vm, config)
+    block = config['block']
+    return lambda: vm.process(block)
+
+def make_looper_case(config):
+    looper = Looper(SAMPLE_RATE)
+    looper.prepare(config['block'])
+    _setup_looper(looper, config)
+    block = config['block']
+    silence = np.zeros(block)
+    return lambda: looper.process(silence, block)
+
+def make_engine_case(config):
+    """Full _callback (voices + looper + mix + history), driven without a stream."""
+    engine = AudioEngine(SAMPLE_RATE, block_size=max(SWEEPS['block']))
+    # Fresh synth/looper state per case (the engine is a singleton)
+    engine.voice_manager = VoiceManager(SAMPLE_RATE, max_voices=max(8, config['voices']))
+    engine.voice_manager.prepare(engine.block_size)
+    engine.looper = Looper(SAMPLE_RATE)
+    engine.looper.prepare(engine.block_size)
+    _setup_voice_manager(engine.voice_manager, config)
+    _setup_looper(engine.looper, config)
+
+    block = config['block']
+    outdata = np.zeros((block, 1))
+    return lambda: engine._callback(outdata, block, None, None)
+
+TARGETS = {
+    'voice_manager': make_voice_manager_case,
+    'looper': make_looper_case,
+    'engine': make_engine_case,
+}
+
+# Axes that matter per target (the looper ignores synth settings)
+TARGET_AXES = {
+    'voice_manager': ['voices', 'waveform', 'block', 'filter'],
+    'looper': ['block', 'pods'],
+    'engine': ['voices', 'waveform', 'block', 'pods', 'filter'],
+}
+
+def time_blocks(render, block, iterations, warmup):
+    for _ in range(warmup):
+        render()
+    timings = np.zeros(iterations)
+    for i in range(iterations):
+        start = time.perf_counter()
+        render()
+        timings[i] = time.perf_counter() - start
+
+    timings_us = timings * 1e6
+    block_us = block / SAMPLE_RATE * 1e6
+    mean_us = float(np.mean(timings_us))
+    return {
+        'mean_us': mean_us,
+        'p50_us': float(np.percentile(timings_us, 50)),
+        'p99_us': float(np.percentile(timings_us, 99)),
+        'max_us': float(np.max(timings_us)),
+        'rtf': block_us / mean_us if mean_us > 0 else float('inf'),
+    }
+
+def case_name(target, config):
+    return f"{target}/voices={config['voices']}/wave={config['waveform']}/block={config['block']}/pods={config['pods']}/filter={config['filter']}"
+
+def build_cases(targets):
+    """Unique (name, target, config) for every one-axis sweep around DEFAULTS."""
+    cases = []
+    seen = set()
+    for target in targets:
+        for axis in TARGET_AXES[target]:
+            for value in SWEEPS[axis]:
+                config = dict(DEFAULTS)
+                config[axis] = value
+                name = case_name(target, config)
+                if name not in seen:
+                    seen.add(name)
+                    cases.append((name, target, config))
+    return cases
+
+def run(targets=('voice_manager', 'looper', 'engine'), iterations=200, warmup=20, pattern=None):
+    if 'engine' in targets and AudioEngine is None:
+        print(f"Skipping engine benchmarks: {ENGINE_ERROR}")
+        targets = [t for t in targets if t != 'engine']
+
+    results = {}
+    for name, target, config in build_cases(targets):
+        if pattern and pattern not in name:
+            continue
+        render = TARGETS[target](config)
+        results[name] = time_blocks(render, config['block'], iterations, warmup)
+    return results
+
+def compare(results, baseline, threshold):
+    """Names of cases whose mean time grew by more than threshold (fraction) vs the baseline."""
+    regressions = []
+    for name, stats in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if stats['mean_us'] > base['mean_us'] * (1.0 + threshold):
+            regressions.append(name)
+    return regressions
+
+def print_report(results, baseline=None):
+    print(f"{'case':<75} {'mean':>9} {'p50':>9} {'p99':>9} {'max':>9} {'RTF':>8}  {'vs base':>8}")
+    for name, s in results.items():
+        delta = ""
+        if baseline and name in baseline:
+            delta = f"{(s['mean_us'] / baseline[name]['mean_us'] - 1.0) * 100:+.1f}%"
+        print(f"{name:<75} {s['mean_us']:9.1f} {s['p50_us']:9.1f} {s['p99_us']:9.1f} {s['max_us']:9.1f} {s['rtf']:8.1f}  {delta:>8}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Synth DSP benchmarks (times in microseconds per block).")
+    parser.add_argument("--target", action="append", choices=list(TARGETS), help="Limit to a target (repeatable)")
+    parser.add_argument("--filter", dest="pattern", default=None, help="Only cases whose name contains this text")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--save", metavar="PATH", help="Write results as a baseline JSON file")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against a baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed slowdown vs baseline (0.15 = 15%%)")
+    args = parser.parse_args()
+
+    targets = args.target or list(TARGETS)
+    results = run(targets, args.iterations, args.warmup, args.pattern)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+
+    print_report(results, baseline)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.save}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold * 100:.0f}%:")
+            for name in regressions:
+                print(f"  {name}")
+            sys.exit(1)
+        print("No regressions.")
+
+if __name__ == "__main__":
+    main()
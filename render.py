@@ -0,0 +1,31 @@
+import sys
+import os
+import argparse
+import logging
+
+# Ensure the current directory is in sys.path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.audio.offline import OfflineRenderer, load_session
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a Synth event file to WAV without an audio device.")
+    parser.add_argument("events", help="JSON event file ({\"duration\": ..., \"params\": {...}, \"events\": [...]})")
+    parser.add_argument("output", help="Output WAV path")
+    parser.add_argument("--sample-rate", type=int, default=44100)
+    parser.add_argument("--block-size", type=int, default=1024)
+    parser.add_argument("--duration", type=float, default=None, help="Override the length in seconds")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(name)s: %(message)s')
+
+    events, duration = load_session(args.events)
+    if args.duration is not None:
+        duration = args.duration
+
+    renderer = OfflineRenderer(args.sample_rate, args.block_size)
+    frames = renderer.render_to_wav(events, duration, args.output)
+    print(f"Wrote {frames} frames ({frames / args.sample_rate:.2f}s) to {args.output}")
+
+if __name__ == "__main__":
+    main()
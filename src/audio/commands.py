@@ -0,0 +1,96 @@
+import logging
+
+# Opcodes for control commands sent from the UI thread to the audio thread
+NOTE_ON = 1
+NOTE_OFF = 2
+SET_PARAM = 3
+LOOPER_TRIGGER = 4
+LOOPER_STOP = 5
+LOOPER_RECORD = 6
+LOOPER_PAUSE = 7
+LOOPER_REPEAT = 8
+LOOPER_STOP_ALL = 9
+
+def apply_command(voice_manager, looper, op, target, value):
+    """Execute one command against a VoiceManager / Looper pair (live engine or offline renderer)."""
+    if op == NOTE_ON:
+        voice_manager.note_on(target)
+    elif op == NOTE_OFF:
+        voice_manager.note_off(target)
+    elif op == SET_PARAM:
+        voice_manager.set_param(target, value)
+    elif op == LOOPER_STOP_ALL:
+        looper.stop_all()
+    elif 0 <= target < len(looper.pods):
+        pod = looper.pods[target]
+        if op == LOOPER_TRIGGER:
+            pod.trigger()
+        elif op == LOOPER_STOP:
+            pod.stop()
+        elif op == LOOPER_RECORD:
+            pod.record()
+        elif op == LOOPER_PAUSE:
+            pod.pause()
+        elif op == LOOPER_REPEAT:
+            pod.set_repeat(value)
+
+class CommandQueue:
+    """
+    Bounded single-producer / single-consumer queue of control commands.
+
+    Every command is a compact (opcode, target, value, sample_time) record stored
+    in preallocated slots; push() and drain() only move references and bump
+    monotonic indices, so neither side takes a lock or allocates.
+    The UI (Qt) thread is the only producer, the audio callback the only consumer.
+
+    sample_time is the engine sample clock position the command should land on.
+    Commands are consumed in FIFO order, so producers push nondecreasing times.
+    """
+    def __init__(self, capacity=1024):
+        self.capacity = capacity
+        self._op = [0] * capacity
+        self._target = [0] * capacity
+        self._value = [None] * capacity
+        self._time = [0] * capacity
+
+        # Total commands ever written / read. Only the producer bumps write_index,
+        # only the consumer bumps read_index.
+        self.write_index = 0
+        self.read_index = 0
+        self.dropped = 0
+
+    def push(self, op, target=0, value=None, sample_time=0):
+        """Queue a command. Returns False (and drops it) if the queue is full."""
+        if self.write_index - self.read_index >= self.capacity:
+            self.dropped += 1
+            logging.warning(f"Command queue full, dropped opcode {op}")
+            return False
+
+        slot = self.write_index % self.capacity
+        self._op[slot] = op
+        self._target[slot] = target
+        self._value[slot] = value
+        self._time[slot] = sample_time
+        # Publish only after the record is complete
+        self.write_index += 1
+        return True
+
+    def pending(self):
+        return self.write_index - self.read_index
+
+    def peek_time(self):
+        """sample_time of the oldest queued command (queue must not be empty)."""
+        return self._time[self.read_index % self.capacity]
+
+    def pop(self, handler):
+        """Call handler(op, target, value) for the oldest queued command and remove it."""
+        slot = self.read_index % self.capacity
+        handler(self._op[slot], self._target[slot], self._value[slot])
+        self._value[slot] = None # Don't keep UI objects alive from the ring
+        self.read_index += 1
+
+    def drain(self, handler):
+        """Call handler(op, target, value) for every queued command, in order, ignoring times."""
+        end = self.write_index
+        while self.read_index < end:
+            self.pop(handler)
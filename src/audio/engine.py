@@ -2,8 +2,16 @@ import sounddevice as sd
 import numpy as np
 from .voice_manager import VoiceManager
 from .looper import Looper
+from .filter import coefficient_cache
+from .ring_buffer import RingBuffer
+from . import commands
+from .commands import CommandQueue
+from . import telemetry
+from .telemetry import CallbackTelemetry
+from .looper import PodState
 import threading
 import logging
+import time
 
 class AudioEngine:
     _instance = None
@@ -23,18 +31,40 @@ class AudioEngine:
         
         self.voice_manager = VoiceManager(sample_rate)
         self.looper = Looper(sample_rate)
+
+        # Real-time render mode: every component gets its scratch buffers now,
+        # so the callback allocates no block-sized arrays in steady state
+        self.voice_manager.prepare(block_size)
+        self.looper.prepare(block_size)
+        self.mix_buffer = np.zeros(block_size)
+        self.voice_buffer = np.zeros(block_size)
+        self.ufunc_bufsize = 1024
+
+        # Sample clock: frames rendered since the engine was created.
+        # _clock_anchor is (sample_clock, perf_counter) at the start of the last
+        # block, published as one tuple so the UI thread never sees a torn pair.
+        self.sample_clock = 0
+        self._clock_anchor = (0, time.perf_counter())
         
         # Audio Stream
         self.stream = None
         self.is_running = False
         
-        # Visualization Buffer
-        self.current_buffer = np.zeros(block_size)
-        self.buffer_lock = threading.Lock()
+        # Visualization history: lock-free SPSC ring of recent output
+        # (audio thread writes, UI reads zero-copy windows)
+        self.history_seconds = 5.0
+        self.history = RingBuffer(int(self.history_seconds * sample_rate))
         
         # Master Volume
         self.volume = 0.5
 
+        # Always-on callback instrumentation (see get_stats())
+        self.telemetry = CallbackTelemetry(sample_rate)
+
+        # Control commands from the UI thread, drained by the audio thread each block
+        self.commands = CommandQueue()
+        self._apply = self._apply_command # Bound once, not per block
+
     def start(self):
         if self.is_running:
             return
@@ -47,8 +77,12 @@ class AudioEngine:
                 callback=self._callback,
                 latency='low' # Try low latency
             )
+            self._clock_anchor = (self.sample_clock, time.perf_counter())
             self.stream.start()
             self.is_running = True
+
+            # Warm the shared filter design cache over the cutoff dial range (off the UI thread)
+            threading.Thread(target=coefficient_cache.precompute, args=('lowpass', self.sample_rate), daemon=True).start()
             logging.info(f"Audio Engine Started: Sample Rate={self.sample_rate}, Block Size={self.block_size}, Latency=low")
         except Exception as e:
             logging.error(f"Error starting audio stream: {e}", exc_info=True)
@@ -59,93 +93,188 @@ class AudioEngine:
             self.stream.stop()
             self.stream.close()
             self.is_running = False
+            # Nothing drains the queue any more; apply what is left
+            self.commands.drain(self._apply)
             logging.info("Audio Engine Stopped")
             print("Audio Engine Stopped")
 
-    def _callback(self, outdata, frames, time, status):
+    def _callback(self, outdata, frames, time_info, status):
+        stats = self.telemetry
+        stats.begin_block(status)
         if status:
             logging.warning(f"Stream Status: {status}")
             print(f"Stream Status: {status}")
             
         try:
-            # 1. Get audio from Synth Voices
-            voice_block = self.voice_manager.process(frames)
-            
-            # 2. Process Looper (Record Input: voice_block)
-            # Returns: Looper Playback Output
-            looper_block = self.looper.process(voice_block, frames)
-            
-            # 3. Mix Synth + Looper
-            mixed_block = voice_block + looper_block
+            # Keep NumPy's ufunc iterator buffers small on the audio thread:
+            # broadcast ops in the voice bank otherwise grab an 8192-element
+            # buffer per call (setbufsize is per-thread/context, so set it here)
+            np.setbufsize(self.ufunc_bufsize)
+
+            block_start = self.sample_clock
+            self._clock_anchor = (block_start, time.perf_counter())
+
+            if frames > len(self.mix_buffer):
+                self.mix_buffer = np.zeros(frames)
+                self.voice_buffer = np.zeros(frames)
+
+            # Render the block in segments split at command timestamps, so every
+            # queued note/param/looper command lands on its exact sample
+            pos = 0
+            commands_queue = self.commands
+            while commands_queue.pending():
+                offset = commands_queue.peek_time() - block_start
+                if offset >= frames:
+                    break # Belongs to a later block
+                if offset > pos:
+                    self._render_segment(pos, offset)
+                    pos = offset
+                started = time.perf_counter()
+                commands_queue.pop(self._apply)
+                stats.add_stage(telemetry.STAGE_COMMANDS, started)
+            if pos < frames:
+                self._render_segment(pos, frames)
+
+            mixed_block = self.mix_buffer[:frames]
+            self.sample_clock = block_start + frames
             
             # Master Volume
+            started = time.perf_counter()
             mixed_block *= self.volume
+            started = stats.add_stage(telemetry.STAGE_MIX, started)
             
-            # Update Visualization Buffer (Copy safely)
-            with self.buffer_lock:
-                # If buffer sizes act weird, just take what fits or pad
-                if len(mixed_block) == len(self.current_buffer):
-                    self.current_buffer[:] = mixed_block
-                else:
-                     # Should match frames == block_size generally
-                     pass
+            # Update Visualization History (no lock, never blocks on the UI)
+            self.history.write(mixed_block)
+            stats.add_stage(telemetry.STAGE_VIZ, started)
             
-            # Write to output (reshape for sounddevice channels)
-            outdata[:] = mixed_block.reshape(-1, 1)
+            # Write to output (mono channel 0, no reshape copy)
+            outdata[:, 0] = mixed_block
         except Exception as e:
             logging.error(f"Error in Audio Callback: {e}", exc_info=True)
             # Silence output on error to avoid noise
             outdata.fill(0)
 
-    # Proxy methods to VoiceManager
-    def note_on(self, freq):
-        self.voice_manager.note_on(freq)
+        stats.end_block(frames, self.voice_manager.active_count(), self._active_pod_count())
 
-    def note_off(self, freq):
-        self.voice_manager.note_off(freq)
+    def _render_segment(self, start, end):
+        stats = self.telemetry
+        frames = end - start
+        # 1. Get audio from Synth Voices (scratch output, copied out before the next segment)
+        started = time.perf_counter()
+        voice_block = self.voice_buffer[start:end]
+        voice_block[:] = self.voice_manager.process(frames)
+        started = stats.add_stage(telemetry.STAGE_VOICES, started)
 
-    def set_synth_param(self, name, value):
-        self.voice_manager.set_param(name, value)
+        # 2. Process Looper (Record Input: voice_block)
+        # Returns: Looper Playback Output
+        looper_block = self.looper.process(voice_block, frames)
+        started = stats.add_stage(telemetry.STAGE_LOOPER, started)
+
+        # 3. Mix Synth + Looper (into the preallocated mix bus)
+        np.add(voice_block, looper_block, out=self.mix_buffer[start:end])
+        stats.add_stage(telemetry.STAGE_MIX, started)
+
+    def _active_pod_count(self):
+        count = 0
+        for pod in self.looper.pods:
+            if pod.state == PodState.PLAYING or pod.state == PodState.RECORDING:
+                count += 1
+        return count
+
+    def get_stats(self):
+        """
+        Callback telemetry snapshot: cpu_load / peak_load (% of the block deadline),
+        deadline_misses, xruns, active_voices, active_pods, per-stage
+        stage_avg_us / stage_max_us and the load histogram.
+        """
+        return self.telemetry.stats()
+
+    def now_samples(self):
+        """
+        Estimate of the sample clock position being rendered right now,
+        extrapolated from the start of the last block.
+        """
+        anchor_sample, anchor_time = self._clock_anchor
+        elapsed = time.perf_counter() - anchor_time
+        return anchor_sample + int(elapsed * self.sample_rate)
+
+    # Control path: UI-side methods only queue compact commands; the audio
+    # thread applies them inside the render loop, so voice, filter and
+    # looper state is only ever touched from one thread while streaming.
+    # Commands are stamped with a sample clock time: one block after "now"
+    # unless given, so UI events get a constant latency instead of
+    # block-boundary jitter.
+    def _send(self, op, target=0, value=None, sample_time=None):
+        if not self.is_running:
+            # No callback to drain the queue (tests, offline use): apply directly
+            self._apply_command(op, target, value)
+            return
+        if sample_time is None:
+            sample_time = self.now_samples() + self.block_size
+        self.commands.push(op, target, value, sample_time)
+
+    def _apply_command(self, op, target, value):
+        commands.apply_command(self.voice_manager, self.looper, op, target, value)
+
+    # sample_time (optional): absolute sample clock position to apply the change at
+    def note_on(self, freq, sample_time=None):
+        self._send(commands.NOTE_ON, freq, sample_time=sample_time)
+
+    def note_off(self, freq, sample_time=None):
+        self._send(commands.NOTE_OFF, freq, sample_time=sample_time)
+
+    def set_synth_param(self, name, value, sample_time=None):
+        self._send(commands.SET_PARAM, name, value, sample_time)
         
     def get_buffer(self):
-        with self.buffer_lock:
-            return np.copy(self.current_buffer)
+        # Copy of the most recent block (zero-padded until the first block arrives)
+        buffer = np.zeros(self.block_size)
+        recent = self.history.latest(self.block_size)
+        buffer[len(buffer) - len(recent):] = recent
+        return buffer
+
+    def get_history(self, num_samples):
+        """
+        Zero-copy view of the last num_samples of output (up to history_seconds).
+        The view aliases the ring, so copy it if it must outlive a few seconds.
+        """
+        return self.history.latest(num_samples)
 
     # Looper Controls
-    def looper_trigger(self, pod_index):
+    def looper_trigger(self, pod_index, sample_time=None):
         if self.looper:
             # Bounds check managed by looper or panel, but safe to check here
             if 0 <= pod_index < len(self.looper.pods):
-                self.looper.pods[pod_index].trigger()
-                logging.info(f"Looper Pod {pod_index} Triggered. New State: {self.looper.pods[pod_index].state}")
+                self._send(commands.LOOPER_TRIGGER, pod_index, sample_time=sample_time)
+                logging.info(f"Looper Pod {pod_index} Trigger sent.")
 
     def looper_stop(self, pod_index):
         if self.looper:
             if 0 <= pod_index < len(self.looper.pods):
-                self.looper.pods[pod_index].stop()
+                self._send(commands.LOOPER_STOP, pod_index)
                 logging.info(f"Looper Pod {pod_index} Stopped.")
 
     def looper_record(self, pod_index):
         if self.looper:
             if 0 <= pod_index < len(self.looper.pods):
-                self.looper.pods[pod_index].record()
+                self._send(commands.LOOPER_RECORD, pod_index)
                 logging.info(f"Looper Pod {pod_index} Record (Forced).")
 
     def looper_pause(self, pod_index):
         if self.looper:
             if 0 <= pod_index < len(self.looper.pods):
-                self.looper.pods[pod_index].pause()
+                self._send(commands.LOOPER_PAUSE, pod_index)
                 logging.info(f"Looper Pod {pod_index} toggle Pause.")
 
     def looper_set_repeat(self, pod_index, enabled):
         if self.looper:
             if 0 <= pod_index < len(self.looper.pods):
-                self.looper.pods[pod_index].set_repeat(enabled)
+                self._send(commands.LOOPER_REPEAT, pod_index, enabled)
                 logging.info(f"Looper Pod {pod_index} Repeat: {enabled}")
 
     def looper_stop_all(self):
         if self.looper:
-            self.looper.stop_all()
+            self._send(commands.LOOPER_STOP_ALL)
             logging.info("Looper Stop All")
 
     def looper_get_state(self, pod_index):
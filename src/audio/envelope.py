@@ -26,6 +26,22 @@ class ADSREnvelope:
         self.decay_rate = 0.0
         self.release_rate = 0.0
 
+        # Real-time mode scratch (see prepare())
+        self._ramp = None
+        self._output = None
+
+    def prepare(self, max_frames):
+        """Preallocate scratch buffers so get_amplitude() allocates nothing for blocks <= max_frames."""
+        self._ramp = np.arange(max_frames, dtype=float)
+        self._output = np.zeros(max_frames)
+
+    def _fill_ramp(self, out, start_level, slope):
+        # Same values as np.linspace(start, start + slope * count, count, endpoint=False)
+        count = len(out)
+        ramp = self._ramp[:count] if self._ramp is not None and count <= len(self._ramp) else np.arange(count)
+        np.multiply(ramp, slope, out=out)
+        out += start_level
+
     def set_params(self, attack, decay, sustain, release):
         self.attack_time = max(0.001, attack)
         self.decay_time = max(0.001, decay)
@@ -54,7 +70,11 @@ class ADSREnvelope:
         pass
 
     def get_amplitude(self, num_samples):
-        output = np.zeros(num_samples)
+        if self._output is not None and num_samples <= len(self._output):
+            output = self._output[:num_samples]
+            output.fill(0.0)
+        else:
+            output = np.zeros(num_samples)
         
         if self.state == EnvelopeState.IDLE:
             return output
@@ -86,7 +106,7 @@ class ADSREnvelope:
                 count = min(steps, available)
                 # Create ramp
                 end_level = self.current_level + self.attack_rate * count
-                output[start_idx:start_idx+count] = np.linspace(self.current_level, end_level, count, endpoint=False)
+                self._fill_ramp(output[start_idx:start_idx+count], self.current_level, self.attack_rate)
                 
                 self.current_level = end_level
                 start_idx += count
@@ -104,7 +124,7 @@ class ADSREnvelope:
                 
                 count = min(steps, available)
                 end_level = self.current_level - self.decay_rate * count
-                output[start_idx:start_idx+count] = np.linspace(self.current_level, end_level, count, endpoint=False)
+                self._fill_ramp(output[start_idx:start_idx+count], self.current_level, -self.decay_rate)
                 
                 self.current_level = end_level
                 start_idx += count
@@ -129,7 +149,7 @@ class ADSREnvelope:
                 
                 count = min(steps, available)
                 end_level = self.current_level - self.release_rate * count
-                output[start_idx:start_idx+count] = np.linspace(self.current_level, end_level, count, endpoint=False)
+                self._fill_ramp(output[start_idx:start_idx+count], self.current_level, -self.release_rate)
                 
                 self.current_level = end_level
                 start_idx += count
@@ -1,5 +1,132 @@
 import numpy as np
 from scipy import signal
+from collections import OrderedDict
+import threading
+
+def design_coefficients(filter_type, cutoff, resonance, sample_rate):
+    # Design a 2nd order Butterworth filter (12dB/octave)
+    # Using output='sos' (Second-Order Sections) is generally more stable usually
+    # But lfilter_zi with ba format is easier for state management in simple real-time
+    # Let's try 'ba' first.
+    nyquist = sample_rate / 2.0
+    norm_cutoff = cutoff / nyquist
+
+    # Resonant Lowpass in scipy:
+    # Butterworth has fixed Q=0.707, so "Resonance" above 1.0 is emulated with
+    # Chebyshev Type I (cheby1) ripple (rp is decibels of ripple).
+    # Requirements said "Integration of SciPy.signal IIR filters", so we MUST use scipy.
+    if resonance > 1.0:
+        b, a = signal.cheby1(N=2, rp=resonance, Wn=norm_cutoff, btype=filter_type, output='ba')
+    else:
+        b, a = signal.butter(N=2, Wn=norm_cutoff, btype=filter_type, output='ba')
+    return b, a
+
+class FilterCoefficientCache:
+    """
+    Process-wide cache of filter designs shared by every voice.
+    Keys are quantized (type, cutoff, resonance, sample_rate), so a dial sweep
+    or 8 voices receiving the same cutoff only run scipy's design once per step.
+    Designs are returned as read-only arrays; callers share them, never modify.
+    """
+    def __init__(self, max_entries=512, steps_per_octave=48, resonance_step=0.05):
+        self.max_entries = max_entries
+        self.steps_per_octave = steps_per_octave
+        self.resonance_step = resonance_step
+
+        self._entries = OrderedDict() # LRU: key -> (b, a, sos)
+        self._tables = {} # Precomputed (pinned) designs, never evicted
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def quantize(self, filter_type, cutoff, resonance, sample_rate):
+        """Returns the cache key and the (cutoff, resonance) actually designed."""
+        # Cutoff on a log grid (steps_per_octave steps above 20 Hz)
+        step = int(round(np.log2(max(cutoff, 20.0) / 20.0) * self.steps_per_octave))
+        q_cutoff = 20.0 * 2.0 ** (step / self.steps_per_octave)
+        q_cutoff = min(q_cutoff, sample_rate / 2.0 - 100)
+
+        # Butterworth ignores resonance, so every resonance <= 1.0 shares one design
+        if resonance > 1.0:
+            res_step = int(round(resonance / self.resonance_step))
+            q_resonance = max(res_step * self.resonance_step, 1.0 + self.resonance_step)
+        else:
+            res_step = 0
+            q_resonance = resonance
+
+        key = (filter_type, step, res_step, sample_rate)
+        return key, q_cutoff, q_resonance
+
+    def get(self, filter_type, cutoff, resonance, sample_rate):
+        """Transfer function (b, a) for Filter / lfilter."""
+        b, a, _ = self._lookup(filter_type, cutoff, resonance, sample_rate)
+        return b, a
+
+    def get_sos(self, filter_type, cutoff, resonance, sample_rate):
+        """Second-order sections for sosfilt (BatchFilter)."""
+        return self._lookup(filter_type, cutoff, resonance, sample_rate)[2]
+
+    def _lookup(self, filter_type, cutoff, resonance, sample_rate):
+        key, q_cutoff, q_resonance = self.quantize(filter_type, cutoff, resonance, sample_rate)
+
+        with self._lock:
+            coeffs = self._tables.get(key)
+            if coeffs is None:
+                coeffs = self._entries.get(key)
+                if coeffs is not None:
+                    self._entries.move_to_end(key)
+            if coeffs is not None:
+                self.hits += 1
+                return coeffs
+            self.misses += 1
+
+        # Design outside the lock (scipy call is the slow part)
+        coeffs = self._design(filter_type, q_cutoff, q_resonance, sample_rate)
+
+        with self._lock:
+            self._entries[key] = coeffs
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return coeffs
+
+    def precompute(self, filter_type, sample_rate, cutoff_range=(20.0, 10000.0), resonances=(0.7,)):
+        """
+        Pin every quantized design over a dial range (e.g. the SynthPanel cutoff dial).
+        Safe to run from a background thread.
+        """
+        low = int(round(np.log2(max(cutoff_range[0], 20.0) / 20.0) * self.steps_per_octave))
+        high = int(round(np.log2(max(cutoff_range[1], 20.0) / 20.0) * self.steps_per_octave))
+
+        for resonance in resonances:
+            for step in range(low, high + 1):
+                cutoff = 20.0 * 2.0 ** (step / self.steps_per_octave)
+                key, q_cutoff, q_resonance = self.quantize(filter_type, cutoff, resonance, sample_rate)
+                if key in self._tables:
+                    continue
+                coeffs = self._design(filter_type, q_cutoff, q_resonance, sample_rate)
+                with self._lock:
+                    self._tables[key] = coeffs
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tables.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @staticmethod
+    def _design(filter_type, cutoff, resonance, sample_rate):
+        b, a = design_coefficients(filter_type, cutoff, resonance, sample_rate)
+        sos = signal.tf2sos(b, a)
+        # sos stays writeable: sosfilt's Cython kernel rejects read-only buffers
+        b.flags.writeable = False
+        a.flags.writeable = False
+        return b, a, sos
+
+# Shared by all Filter instances in the process
+coefficient_cache = FilterCoefficientCache()
 
 class Filter:
     def __init__(self, sample_rate=44100):
@@ -16,59 +143,101 @@ class Filter:
         self._update_coefficients()
 
     def _update_coefficients(self):
-        # Design a 2nd order Butterworth filter (12dB/octave)
-        # Using output='sos' (Second-Order Sections) is generally more stable usually
-        # But lfilter_zi with ba format is easier for state management in simple real-time
-        # Let's try 'ba' first.
-        nyquist = self.sample_rate / 2.0
-        norm_cutoff = self.cutoff / nyquist
-        
-        # Calculate b, a coefficients
-        # Warning: iirfilter resonance is not directly 'Q' in this function easily.
-        # better to use iirfilter or specialized functions.
-        # For a standard synth filter, we might want a resonant Lowpass.
-        # We can use 'bessel', 'butter', etc. with iirfilter.
-        
-        # Let's use a standard biquad calculation if we want precise control over Q (Resonance)
-        # Or use scipy's design. 
-        # For simplicity, we'll use butterworth. High resonance in digital filters 
-        # via standard butterworth Q is minimal. 
-        
-        # Alternative: Manual Biquad implementation for proper "Resonance" control
-        # This is often better for synths.
-        pass 
-        # Actually, let's stick to scipy for now as requested.
-        # We will map 'resonance' to something available or just ignore Q for butterworth
-        # (Butterworth has fixed Q=0.707).
-        # PROPOSED CHECK: If user wants "Resonance", we usually need a Chebyshev or custom Biquad.
-        
-        # Let's use `scipy.signal.iirpeak` or similar if we want resonance? 
-        # No, let's implement a simple Biquad manually for best synth sound.
-        # BUT requirements said "Integration of SciPy.signal IIR filters".
-        # So we MUST use scipy.
-        
-        # Resonant Lowpass in scipy:
-        # We can use Chebyshev Type I (cheby1) which allows ripple (resonance kind of).
-        
-        if self.resonance > 1.0:
-            # Emulate resonance with ripple
-            # rp is decibels of ripple
-             self.b, self.a = signal.cheby1(N=2, rp=self.resonance, Wn=norm_cutoff, btype=self.filter_type, output='ba')
-        else:
-             self.b, self.a = signal.butter(N=2, Wn=norm_cutoff, btype=self.filter_type, output='ba')
-             
+        # Coefficients come from the shared cache: voices with the same
+        # settings share one (read-only) b/a pair instead of redesigning it.
+        self.b, self.a = coefficient_cache.get(self.filter_type, self.cutoff, self.resonance, self.sample_rate)
+
         if self.zi is None:
              self.zi = signal.lfilter_zi(self.b, self.a)
 
     def process(self, data):
         if self.zi is None:
             self.zi = signal.lfilter_zi(self.b, self.a) * data[0]
-            
+
         # For block processing with state retention
         # We must re-calculate zi if coefficients changed, but keeping continuity is hard if coeffs change.
         # Resetting zi on coeff change can cause pops.
         # For this logic, we will just apply lfilter.
         # Note: Scipy lfilter state management can be tricky with changing coeffs.
-        
+
         out_data, self.zi = signal.lfilter(self.b, self.a, data, zi=self.zi)
         return out_data
+
+
+class BatchFilter:
+    """
+    One filter stage for a whole voice matrix.
+    The state of every voice is stacked into a single (sections, voices, 2)
+    array, so all active voices are filtered with one sosfilt call along the
+    sample axis. Cutoff/resonance changes glide over ramp_time in short
+    segments (each a cached design) while the state carries over, so
+    parameter moves neither reset the filter nor pop.
+    """
+    def __init__(self, sample_rate=44100, max_voices=8, ramp_time=0.05, segment_size=32):
+        self.sample_rate = sample_rate
+        self.max_voices = max_voices
+        self.filter_type = 'lowpass'
+        self.segment_size = segment_size
+        self.ramp_samples = max(1, int(ramp_time * sample_rate))
+
+        # Current (audible) and target params
+        self.cutoff = 1000.0
+        self.resonance = 0.7
+        self.target_cutoff = self.cutoff
+        self.target_resonance = self.resonance
+        self._ramp_remaining = 0
+
+        self.sos = coefficient_cache.get_sos(self.filter_type, self.cutoff, self.resonance, sample_rate)
+        self.zi = np.zeros((self.sos.shape[0], max_voices, 2))
+
+    def set_params(self, cutoff, resonance, immediate=False):
+        self.target_cutoff = float(np.clip(cutoff, 20.0, self.sample_rate / 2.0 - 100))
+        self.target_resonance = max(0.1, resonance)
+        if immediate:
+            self.cutoff = self.target_cutoff
+            self.resonance = self.target_resonance
+            self._ramp_remaining = 0
+            self.sos = self._design(self.cutoff, self.resonance)
+        else:
+            self._ramp_remaining = self.ramp_samples
+
+    def reset(self, slots=None):
+        if slots is None:
+            self.zi.fill(0.0)
+        else:
+            self.zi[:, slots, :] = 0.0
+
+    def _design(self, cutoff, resonance):
+        return coefficient_cache.get_sos(self.filter_type, cutoff, resonance, self.sample_rate)
+
+    def process(self, data, slots):
+        """
+        data: (len(slots), num_samples) block, one row per voice slot.
+        slots: voice slot indices (rows of the stacked state).
+        """
+        zi = self.zi[:, slots, :]
+
+        if self._ramp_remaining <= 0:
+            out, zi = signal.sosfilt(self.sos, data, axis=-1, zi=zi)
+        else:
+            # Glide params towards target, one cached design per segment
+            num_samples = data.shape[-1]
+            out = np.empty_like(data)
+            pos = 0
+            while pos < num_samples:
+                count = min(self.segment_size, num_samples - pos)
+                if self._ramp_remaining > 0:
+                    frac = min(1.0, count / self._ramp_remaining)
+                    # Cutoff glides on a log scale (musical), resonance linearly
+                    self.cutoff *= (self.target_cutoff / self.cutoff) ** frac
+                    self.resonance += (self.target_resonance - self.resonance) * frac
+                    self._ramp_remaining -= count
+                    if self._ramp_remaining <= 0:
+                        self.cutoff = self.target_cutoff
+                        self.resonance = self.target_resonance
+                    self.sos = self._design(self.cutoff, self.resonance)
+                out[:, pos:pos + count], zi = signal.sosfilt(self.sos, data[:, pos:pos + count], axis=-1, zi=zi)
+                pos += count
+
+        self.zi[:, slots, :] = zi
+        return out
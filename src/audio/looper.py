@@ -20,6 +20,13 @@ class LooperPod:
         # Temp buffer for recording
         self.rec_buffer_list = []
 
+        # Real-time mode output scratch (see prepare())
+        self._output = None
+
+    def prepare(self, max_frames):
+        """Preallocate the output block so process() does not allocate (real-time mode)."""
+        self._output = np.zeros(max_frames)
+
     def record(self):
         """
         Force start recording.
@@ -98,7 +105,11 @@ class LooperPod:
         self.is_repeat = enabled
 
     def process(self, input_chunk, num_samples):
-        output = np.zeros(num_samples)
+        if self._output is not None and num_samples <= len(self._output):
+            output = self._output[:num_samples]
+            output.fill(0.0)
+        else:
+            output = np.zeros(num_samples)
 
         if self.state == PodState.RECORDING:
             # Record input
@@ -155,10 +166,21 @@ class Looper:
     def __init__(self, sample_rate=44100):
         self.sample_rate = sample_rate
         self.pods = [LooperPod(i, sample_rate) for i in range(10)]
+        self._mix = None
+
+    def prepare(self, max_frames):
+        """Real-time mode: preallocate the mix bus and every pod's output block."""
+        for pod in self.pods:
+            pod.prepare(max_frames)
+        self._mix = np.zeros(max_frames)
 
     def process(self, input_audio, num_samples):
         # Mix all pods
-        mixed_output = np.zeros(num_samples)
+        if self._mix is not None and num_samples <= len(self._mix):
+            mixed_output = self._mix[:num_samples]
+            mixed_output.fill(0.0)
+        else:
+            mixed_output = np.zeros(num_samples)
         
         for pod in self.pods:
             mixed_output += pod.process(input_audio, num_samples)
@@ -1,11 +1,21 @@
 import numpy as np
 from abc import ABC, abstractmethod
+from .wavetable import get_wavetable
 
 class Oscillator(ABC):
     def __init__(self, sample_rate=44100):
         self.sample_rate = sample_rate
         self.phase = 0.0
 
+        # Real-time mode scratch (see prepare())
+        self._ramp = None
+        self._phases = None
+
+    def prepare(self, max_frames):
+        """Preallocate scratch buffers so get_samples() allocates nothing for blocks <= max_frames."""
+        self._ramp = np.arange(max_frames, dtype=float)
+        self._phases = np.zeros(max_frames)
+
     @abstractmethod
     def get_samples(self, num_samples, frequency):
         pass
@@ -14,45 +24,88 @@ class Oscillator(ABC):
         # Calculate phase increment per sample
         # frequency (Hz) / sample_rate (Hz) = cycles per sample
         phase_increment = frequency / self.sample_rate
-        
+
         # Create an array of phase steps for the current block
         # np.arange(0, num_samples) creates [0, 1, 2, ... N-1]
         # Multiplying by phase_increment gives relative phase for each sample in block
-        time_steps = np.arange(num_samples) * phase_increment
-        
-        # Add current base phase to all steps
-        phases = self.phase + time_steps
-        
+        if self._phases is not None and num_samples <= len(self._phases):
+            # Prepared: reuse the ramp and write into scratch (result is valid until the next call)
+            phases = np.multiply(self._ramp[:num_samples], phase_increment, out=self._phases[:num_samples])
+            phases += self.phase
+        else:
+            time_steps = np.arange(num_samples) * phase_increment
+
+            # Add current base phase to all steps
+            phases = self.phase + time_steps
+
         # Update self.phase for the next block
         # We start from the phase *after* the last sample in this block
         self.phase += num_samples * phase_increment
         self.phase %= 1.0  # Keep phase in [0.0, 1.0) range for precision
-        
+
         return phases
 
+# Waveforms are computed in place on the phase array returned by _advance_phase
+
 class SineOsc(Oscillator):
     def get_samples(self, num_samples, frequency):
         phases = self._advance_phase(num_samples, frequency)
-        return np.sin(2 * np.pi * phases)
+        phases *= 2 * np.pi
+        return np.sin(phases, out=phases)
 
 class SquareOsc(Oscillator):
     def get_samples(self, num_samples, frequency):
         phases = self._advance_phase(num_samples, frequency)
         # Apply modulo 1.0 to the phases array locally to wrap the wave
-        t = phases % 1.0
+        t = np.remainder(phases, 1.0, out=phases)
         # Square wave: 1.0 if phase < 0.5 else -1.0
-        return np.where(t < 0.5, 1.0, -1.0)
+        # (sign of t - 0.5, flipped; copysign avoids a temporary mask array)
+        t -= 0.5
+        np.copysign(1.0, t, out=t)
+        return np.negative(t, out=t)
 
 class SawOsc(Oscillator):
     def get_samples(self, num_samples, frequency):
         phases = self._advance_phase(num_samples, frequency)
-        t = phases % 1.0
+        t = np.remainder(phases, 1.0, out=phases)
         # Saw wave: linearly from -1.0 to 1.0
-        return 2.0 * t - 1.0
+        t *= 2.0
+        t -= 1.0
+        return t
 
 class TriangleOsc(Oscillator):
     def get_samples(self, num_samples, frequency):
         phases = self._advance_phase(num_samples, frequency)
-        t = phases % 1.0
-        # Triangle wave logic
-        return 2.0 * np.abs(2.0 * t - 1.0) - 1.0
+        t = np.remainder(phases, 1.0, out=phases)
+        # Triangle wave logic: 2 * |2t - 1| - 1
+        t *= 2.0
+        t -= 1.0
+        np.abs(t, out=t)
+        t *= 2.0
+        t -= 1.0
+        return t
+
+class WavetableOsc(Oscillator):
+    """
+    Band-limited oscillator playing a shared, per-octave mipmapped table
+    (see wavetable.py). No transcendental math per block and no aliasing.
+    """
+    def __init__(self, sample_rate=44100, waveform='saw'):
+        super().__init__(sample_rate)
+        self.waveform = waveform
+        self.table = get_wavetable(waveform, sample_rate)
+        self._out = None
+        self._index = None
+
+    def prepare(self, max_frames):
+        super().prepare(max_frames)
+        self._out = np.zeros(max_frames)
+        self._index = np.zeros(max_frames, dtype=np.intp)
+
+    def get_samples(self, num_samples, frequency):
+        phases = self._advance_phase(num_samples, frequency)
+        np.remainder(phases, 1.0, out=phases)
+        level = self.table.level_for(frequency)
+        if self._out is not None and num_samples <= len(self._out):
+            return self.table.render(phases, level, out=self._out[:num_samples], index=self._index[:num_samples])
+        return self.table.render(phases, level)
@@ -0,0 +1,69 @@
+import numpy as np
+
+class RingBuffer:
+    """
+    Lock-free single-producer / single-consumer sample history.
+
+    The audio thread is the only writer; readers (UI, analysis) never block it.
+    Storage is mirrored (every sample is written at i and i + capacity), so any
+    window of up to `capacity` recent samples is one contiguous slice and can be
+    handed out as a zero-copy view.
+
+    write_count is the total number of samples ever written. It is only bumped
+    after the data is in place, so a reader that snapshots it always sees
+    complete samples. Views of the oldest part of the buffer can be overwritten
+    while being read; readers that need a stable copy should keep their window
+    well inside the capacity or copy it.
+    """
+    def __init__(self, capacity, dtype=float):
+        self.capacity = int(capacity)
+        self.dtype = np.dtype(dtype)
+        self._data = np.zeros(2 * self.capacity, dtype=self.dtype)
+        self.write_count = 0
+
+    def write(self, block):
+        """Append a block (audio thread only). Never allocates."""
+        n = len(block)
+        if n == 0:
+            return
+        cap = self.capacity
+        if n > cap:
+            # Only the newest `capacity` samples survive anyway
+            skipped = n - cap
+            block = block[skipped:]
+            self.write_count += skipped
+            n = cap
+
+        pos = self.write_count % cap
+        first = min(n, cap - pos)
+        self._data[pos:pos + first] = block[:first]
+        self._data[pos + cap:pos + cap + first] = block[:first]
+
+        rest = n - first
+        if rest > 0:
+            self._data[:rest] = block[first:]
+            self._data[cap:cap + rest] = block[first:]
+
+        # Publish only after the samples are in place
+        self.write_count += n
+
+    def window(self, end, num_samples):
+        """
+        Zero-copy view of the samples with absolute index [end - num_samples, end).
+        `end` is a write_count value (e.g. an earlier snapshot); the window must
+        still be inside the history, otherwise the oldest available part is returned.
+        """
+        num_samples = min(int(num_samples), self.capacity)
+        oldest = max(0, self.write_count - self.capacity)
+        start = max(end - num_samples, oldest)
+        end = max(end, start)
+        offset = start % self.capacity
+        return self._data[offset:offset + (end - start)]
+
+    def latest(self, num_samples):
+        """Zero-copy view of the most recent num_samples samples (fewer if not written yet)."""
+        return self.window(self.write_count, num_samples)
+
+    def clear(self):
+        self._data.fill(0)
+        self.write_count = 0
@@ -0,0 +1,99 @@
+import time
+import numpy as np
+
+# Callback stages timed per block (indices into the stage arrays)
+STAGE_COMMANDS = 0
+STAGE_VOICES = 1
+STAGE_LOOPER = 2
+STAGE_MIX = 3
+STAGE_VIZ = 4
+STAGE_NAMES = ('commands', 'voices', 'looper', 'mix', 'viz')
+
+class CallbackTelemetry:
+    """
+    Always-on audio callback instrumentation.
+
+    The audio thread calls begin_block(), add_stage() per timed stage and
+    end_block(); all counters live in preallocated arrays and plain numbers,
+    so recording costs a few perf_counter() calls per block. The UI reads a
+    snapshot through stats() (values may be one block stale, never blocking).
+
+    Load is callback duration / block duration (1.0 = the whole deadline).
+    The histogram bins load in 5% steps up to 200%, with the last bin catching
+    everything above.
+    """
+    HISTOGRAM_STEP = 0.05
+    HISTOGRAM_BINS = 41
+
+    def __init__(self, sample_rate=44100, smoothing=0.1):
+        self.sample_rate = sample_rate
+        self.smoothing = smoothing
+        self.reset()
+
+    def reset(self):
+        num_stages = len(STAGE_NAMES)
+        self._stage_block = np.zeros(num_stages)   # Seconds in the current block
+        self.stage_avg = np.zeros(num_stages)      # Smoothed seconds per block
+        self.stage_max = np.zeros(num_stages)
+        self.histogram = np.zeros(self.HISTOGRAM_BINS, dtype=np.int64)
+
+        self.blocks = 0
+        self.deadline_misses = 0
+        self.xruns = 0
+        self.load = 0.0       # Smoothed
+        self.peak_load = 0.0
+        self.last_load = 0.0
+        self.active_voices = 0
+        self.active_pods = 0
+        self._block_start = 0.0
+
+    def begin_block(self, status=None):
+        if status:
+            # PortAudio reported an under/overflow for this stream
+            self.xruns += 1
+        self._stage_block.fill(0.0)
+        self._block_start = time.perf_counter()
+        return self._block_start
+
+    def add_stage(self, stage, started):
+        """Accumulate time since `started` into stage; returns now (start of the next stage)."""
+        now = time.perf_counter()
+        self._stage_block[stage] += now - started
+        return now
+
+    def end_block(self, frames, active_voices=0, active_pods=0):
+        duration = time.perf_counter() - self._block_start
+        load = duration * self.sample_rate / frames if frames > 0 else 0.0
+
+        self.blocks += 1
+        self.last_load = load
+        self.load += self.smoothing * (load - self.load)
+        if load > self.peak_load:
+            self.peak_load = load
+        if load > 1.0:
+            self.deadline_misses += 1
+
+        self.histogram[min(int(load / self.HISTOGRAM_STEP), self.HISTOGRAM_BINS - 1)] += 1
+
+        self.stage_avg += self.smoothing * (self._stage_block - self.stage_avg)
+        np.maximum(self.stage_max, self._stage_block, out=self.stage_max)
+
+        self.active_voices = active_voices
+        self.active_pods = active_pods
+
+    def stats(self):
+        """Snapshot for the UI thread (copies, safe to keep)."""
+        return {
+            'blocks': self.blocks,
+            'cpu_load': self.load * 100.0,
+            'peak_load': self.peak_load * 100.0,
+            'last_load': self.last_load * 100.0,
+            'deadline_misses': self.deadline_misses,
+            'xruns': self.xruns,
+            'active_voices': self.active_voices,
+            'active_pods': self.active_pods,
+            'stage_avg_us': {name: self.stage_avg[i] * 1e6 for i, name in enumerate(STAGE_NAMES)},
+            'stage_max_us': {name: self.stage_max[i] * 1e6 for i, name in enumerate(STAGE_NAMES)},
+            'histogram': self.histogram.copy(),
+            'histogram_step': self.HISTOGRAM_STEP,
+        }
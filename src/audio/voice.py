@@ -1,10 +1,10 @@
-from .oscillator import SineOsc, SquareOsc, SawOsc, TriangleOsc
+from .oscillator import SineOsc, SquareOsc, SawOsc, TriangleOsc, WavetableOsc
 from .envelope import ADSREnvelope
 from .filter import Filter
 import numpy as np
 
 class Voice:
-    def __init__(self, sample_rate=44100):
+    def __init__(self, sample_rate=44100, bandlimited=True):
         self.sample_rate = sample_rate
         self.active = False
         self.note = None
@@ -18,18 +18,38 @@ class Voice:
             'saw': SawOsc(sample_rate),
             'triangle': TriangleOsc(sample_rate)
         }
-        self.current_osc = self.oscillators['saw']
+        # Band-limited versions (tables are shared by all voices)
+        self.wavetable_oscillators = {
+            name: WavetableOsc(sample_rate, name) for name in self.oscillators
+        }
+        self.bandlimited = bandlimited
         self.osc_type = 'saw'
+        self.current_osc = self._osc_bank()[self.osc_type]
         
         self.envelope = ADSREnvelope(sample_rate)
         self.filter = Filter(sample_rate)
+        self._silence = None
+
+    def prepare(self, max_frames):
+        """Preallocate scratch buffers of all components (real-time mode)."""
+        for osc in list(self.oscillators.values()) + list(self.wavetable_oscillators.values()):
+            osc.prepare(max_frames)
+        self.envelope.prepare(max_frames)
+        self._silence = np.zeros(max_frames)
         
+    def _osc_bank(self):
+        return self.wavetable_oscillators if self.bandlimited else self.oscillators
+
     def set_osc_type(self, osc_type):
         if osc_type in self.oscillators:
-            self.current_osc = self.oscillators[osc_type]
+            self.current_osc = self._osc_bank()[osc_type]
             # Sync phase? Maybe not needed for simple synth.
             self.osc_type = osc_type
 
+    def set_bandlimited(self, enabled):
+        self.bandlimited = enabled
+        self.current_osc = self._osc_bank()[self.osc_type]
+
     def note_on(self, frequency):
         self.note = frequency
         self.active = True
@@ -43,6 +63,8 @@ class Voice:
         
     def process(self, num_samples):
         if not self.active:
+            if self._silence is not None and num_samples <= len(self._silence):
+                return self._silence[:num_samples]
             return np.zeros(num_samples)
             
         # Get Oscillator block
@@ -58,4 +80,6 @@ class Voice:
         if not self.envelope.active:
             self.active = False
             
-        return filtered_signal * amp_env
+        # lfilter hands back a fresh array, so the envelope can be applied in place
+        filtered_signal *= amp_env
+        return filtered_signal
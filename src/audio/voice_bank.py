@@ -0,0 +1,239 @@
+import numpy as np
+from .envelope import EnvelopeState
+from .filter import BatchFilter
+from .wavetable import get_wavetable
+
+# Waveform shapes evaluated on a 2-D phase matrix (voices x samples), written into out.
+# Phases arrive already wrapped to [0.0, 1.0) (floor is much cheaper than % on arrays).
+def _sine(phases, out):
+    np.multiply(phases, 2 * np.pi, out=out)
+    return np.sin(out, out=out)
+
+def _square(phases, out):
+    # 1.0 if phase < 0.5 else -1.0, without a temporary mask
+    np.subtract(phases, 0.5, out=out)
+    np.copysign(1.0, out, out=out)
+    return np.negative(out, out=out)
+
+def _saw(phases, out):
+    np.multiply(phases, 2.0, out=out)
+    out -= 1.0
+    return out
+
+def _triangle(phases, out):
+    _saw(phases, out)
+    np.abs(out, out=out)
+    out *= 2.0
+    out -= 1.0
+    return out
+
+WAVEFORMS = {
+    'sine': _sine,
+    'square': _square,
+    'saw': _saw,
+    'triangle': _triangle
+}
+
+class VoiceBank:
+    """
+    Struct-of-arrays voice engine.
+    Every voice slot is a row in a set of NumPy arrays (phase, frequency,
+    envelope level/stage, filter state), so all active voices are rendered
+    with a handful of batched array operations per block instead of one
+    Python call chain per voice.
+    """
+    def __init__(self, sample_rate=44100, max_voices=8):
+        self.sample_rate = sample_rate
+        self.max_voices = max_voices
+        self.osc_type = 'saw'
+        self.bandlimited = True # Mipmapped wavetables instead of naive waveforms
+
+        # Oscillator state (phase kept in [0.0, 1.0) like Oscillator._advance_phase)
+        self.phase = np.zeros(max_voices)
+        self.freq = np.zeros(max_voices)
+
+        # Envelope state. Rates are captured on trigger, like ADSREnvelope.trigger()
+        self.stage = np.full(max_voices, EnvelopeState.IDLE.value, dtype=np.int8)
+        self.level = np.zeros(max_voices)
+        self.attack_rate = np.zeros(max_voices)
+        self.decay_rate = np.zeros(max_voices)
+        self.release_rate = np.zeros(max_voices)
+        self.sustain = np.zeros(max_voices)
+
+        # Global envelope params (same defaults/limits as ADSREnvelope)
+        self.attack_time = 0.01
+        self.decay_time = 0.1
+        self.sustain_level = 0.7
+        self.release_time = 0.3
+
+        # One filter stage for all voices (stacked state, gliding coefficients)
+        self.filter = BatchFilter(sample_rate, max_voices)
+
+        # Scratch matrices (voices x samples), reused every block and grown on demand.
+        # After prepare() the mixed output is a reused buffer too (real-time mode).
+        self._prepared = False
+        self._out = None
+        self._allocate_scratch(1024)
+
+    def _allocate_scratch(self, max_frames):
+        # Flat storage: _view() hands out C-contiguous (voices x samples) views,
+        # which ufuncs/take() can write without internal buffering
+        size = self.max_voices * (max_frames + 1)
+        self._ramp = np.arange(max_frames + 1, dtype=float)
+        self._phases = np.zeros(size)
+        self._raw = np.zeros(size)
+        self._env = np.zeros(size)
+        self._work = np.zeros(size)
+        self._index = np.zeros(size, dtype=np.intp)
+        self._mask = np.zeros(size, dtype=bool)
+        self._out = np.zeros(max_frames)
+
+    @staticmethod
+    def _view(buffer, rows, cols):
+        return buffer[:rows * cols].reshape(rows, cols)
+
+    def prepare(self, max_frames):
+        """Preallocate for blocks up to max_frames; process() then allocates no block-sized arrays."""
+        self._allocate_scratch(max_frames)
+        self._prepared = True
+
+    def set_osc_type(self, osc_type):
+        if osc_type in WAVEFORMS:
+            self.osc_type = osc_type
+
+    def set_bandlimited(self, enabled):
+        self.bandlimited = enabled
+
+    def set_envelope(self, attack, decay, sustain, release):
+        self.attack_time = max(0.001, attack)
+        self.decay_time = max(0.001, decay)
+        self.sustain_level = np.clip(sustain, 0.0, 1.0)
+        self.release_time = max(0.001, release)
+
+    def set_filter(self, cutoff, resonance, immediate=False):
+        self.filter.set_params(cutoff, resonance, immediate)
+
+    def note_on(self, slot, frequency):
+        self.freq[slot] = frequency
+        self.stage[slot] = EnvelopeState.ATTACK.value
+        # Same rate definitions as ADSREnvelope.trigger()
+        self.attack_rate[slot] = 1.0 / (self.attack_time * self.sample_rate)
+        self.decay_rate[slot] = (1.0 - self.sustain_level) / (self.decay_time * self.sample_rate)
+        self.release_rate[slot] = 1.0 / (self.release_time * self.sample_rate)
+        self.sustain[slot] = self.sustain_level
+
+    def note_off(self, slot):
+        if self.stage[slot] != EnvelopeState.IDLE.value:
+            self.stage[slot] = EnvelopeState.RELEASE.value
+
+    def is_active(self, slot):
+        return self.stage[slot] != EnvelopeState.IDLE.value
+
+    def active_count(self):
+        return int(np.count_nonzero(self.stage != EnvelopeState.IDLE.value))
+
+    def process(self, num_samples):
+        idx = np.flatnonzero(self.stage != EnvelopeState.IDLE.value)
+        if len(self._out) < num_samples:
+            self._allocate_scratch(num_samples)
+        out = self._out[:num_samples] if self._prepared else np.zeros(num_samples)
+        if len(idx) == 0:
+            out.fill(0.0)
+            return out
+
+        count = len(idx)
+        t = self._ramp[:num_samples]
+
+        # 1. Oscillators: (voices x samples) phase matrix
+        inc = self.freq[idx] / self.sample_rate
+        phases = np.multiply(inc[:, None], t, out=self._view(self._phases, count, num_samples))
+        phases += self.phase[idx, None]
+        work = np.floor(phases, out=self._view(self._work, count, num_samples))
+        phases -= work
+        self.phase[idx] = (self.phase[idx] + num_samples * inc) % 1.0
+        raw = self._view(self._raw, count, num_samples)
+        if self.bandlimited:
+            # Each voice reads the table level that fits its own frequency
+            table = get_wavetable(self.osc_type, self.sample_rate)
+            table.render(phases, table.level_for(self.freq[idx])[:, None], out=raw, index=self._view(self._index, count, num_samples))
+        else:
+            WAVEFORMS[self.osc_type](phases, raw)
+
+        # 2. Filter: one sosfilt call over all voices, state stacked per slot
+        filtered = self.filter.process(raw, idx)
+
+        # 3. Envelopes
+        env = self._render_envelopes(idx, num_samples)
+
+        filtered *= env
+        return np.sum(filtered, axis=0, out=out)
+
+    def _render_envelopes(self, idx, num_samples):
+        """
+        Closed-form linear ADSR for a set of voices.
+        Reproduces ADSREnvelope.get_amplitude sample for sample, but every
+        stage transition is resolved with array masks instead of a per-voice
+        while loop. Evaluated on num_samples + 1 points so the last column
+        gives the level the next block starts from.
+        """
+        stage = self.stage[idx]
+        level = self.level[idx]
+        a_rate = self.attack_rate[idx]
+        d_rate = self.decay_rate[idx]
+        r_rate = self.release_rate[idx]
+
+        attack = stage == EnvelopeState.ATTACK.value
+        sustain = stage == EnvelopeState.SUSTAIN.value
+        release = stage == EnvelopeState.RELEASE.value
+
+        # Samples until each stage reaches its target (int(needed) + 1 in the scalar version)
+        n_att = np.where(attack, np.floor((1.0 - level) / np.maximum(a_rate, 1e-12)) + 1, 0.0)
+        dec_start = np.where(attack, 1.0, level)
+        hold = np.where(sustain, level, self.sustain[idx])
+        n_dec = np.where(sustain, 0.0, np.floor(np.maximum(dec_start - hold, 0.0) / np.maximum(d_rate, 1e-12)) + 1)
+        n_rel = np.floor(level / np.maximum(r_rate, 1e-12)) + 1
+
+        count = len(idx)
+        t = self._ramp[None, :num_samples + 1]
+        env = self._view(self._env, count, num_samples + 1)
+        work = self._view(self._work, count, num_samples + 1)
+        if np.all(sustain):
+            # Steady state: every voice is holding, no per-sample ramp needed
+            env[:] = level[:, None]
+        elif np.all(release):
+            self._release_ramp(env, level, r_rate, t)
+        else:
+            # Decay/sustain branch: max(dec_start - d_rate * (t - n_att), hold)
+            j = np.subtract(t, n_att[:, None], out=work)
+            np.multiply(j, d_rate[:, None], out=env)
+            np.subtract(dec_start[:, None], env, out=env)
+            np.maximum(env, hold[:, None], out=env)
+
+            # Attack branch where t < n_att: level + a_rate * t
+            in_attack = np.less(j, 0.0, out=self._view(self._mask, count, num_samples + 1))
+            np.multiply(a_rate[:, None], t, out=work)
+            work += level[:, None]
+            np.copyto(env, work, where=in_attack)
+
+            if np.any(release):
+                self._release_ramp(work, level, r_rate, t)
+                np.copyto(env, work, where=release[:, None])
+
+        # Next block state
+        j_end = num_samples - n_att
+        new_stage = np.where(j_end < 0, EnvelopeState.ATTACK.value,
+                             np.where(j_end < n_dec, EnvelopeState.DECAY.value, EnvelopeState.SUSTAIN.value))
+        new_stage = np.where(release,
+                             np.where(num_samples >= n_rel, EnvelopeState.IDLE.value, EnvelopeState.RELEASE.value),
+                             new_stage)
+        self.stage[idx] = new_stage
+        self.level[idx] = env[:, num_samples]
+
+        return env[:, :num_samples]
+
+    @staticmethod
+    def _release_ramp(out, level, r_rate, t):
+        # max(level - r_rate * t, 0.0)
+        np.multiply(r_rate[:, None], t, out=out)
+        np.subtract(level[:, None], out, out=out)
+        np.maximum(out, 0.0, out=out)
@@ -1,15 +1,24 @@
 from .voice import Voice
+from .voice_bank import VoiceBank
 import numpy as np
 
 class VoiceManager:
-    def __init__(self, sample_rate=44100, max_voices=8):
+    def __init__(self, sample_rate=44100, max_voices=8, vectorized=True):
         self.sample_rate = sample_rate
-        self.voices = [Voice(sample_rate) for _ in range(max_voices)]
+        self.max_voices = max_voices
+
+        # Render Engine
+        # vectorized=True: all voices live in one VoiceBank (struct-of-arrays, batched DSP)
+        # vectorized=False: classic per-Voice objects (reference path)
+        self.vectorized = vectorized
+        self.bank = VoiceBank(sample_rate, max_voices) if vectorized else None
+        self.voices = [] if vectorized else [Voice(sample_rate) for _ in range(max_voices)]
         self.active_voices = {} # frequency -> voice_index
-        
+
         # Global Synth Params (Should be applied to all voices)
         self.params = {
             'osc_type': 'saw',
+            'bandlimited': True,
             'attack': 0.01,
             'decay': 0.1,
             'sustain': 0.7,
@@ -18,13 +27,45 @@ class VoiceManager:
             'resonance': 0.7
         }
 
+        if self.bank is not None:
+            self.bank.set_filter(self.params['cutoff'], self.params['resonance'], immediate=True)
+
+        self._mix = None
+
+    def prepare(self, max_frames):
+        """
+        Real-time mode: preallocate scratch buffers in every component so
+        process() reuses them instead of allocating. The returned block is
+        then only valid until the next process() call.
+        """
+        if self.bank is not None:
+            self.bank.prepare(max_frames)
+        for voice in self.voices:
+            voice.prepare(max_frames)
+        self._mix = np.zeros(max_frames)
+
     def set_param(self, name, value):
         self.params[name] = value
+
+        if self.bank is not None:
+            # Bank holds params once for all slots
+            if name == 'osc_type':
+                self.bank.set_osc_type(value)
+            elif name == 'bandlimited':
+                self.bank.set_bandlimited(value)
+            elif name in ('attack', 'decay', 'sustain', 'release'):
+                self.bank.set_envelope(self.params['attack'], self.params['decay'], self.params['sustain'], self.params['release'])
+            elif name in ('cutoff', 'resonance'):
+                self.bank.set_filter(self.params['cutoff'], self.params['resonance'])
+            return
+
         # Update all voices live
         # OPTIMIZATION: Only update active voices? No, Idle voices need correct params for next trigger
         for voice in self.voices:
             if name == 'osc_type':
                 voice.set_osc_type(value)
+            elif name == 'bandlimited':
+                voice.set_bandlimited(value)
             elif name == 'attack':
                 voice.envelope.set_params(value, self.params['decay'], self.params['sustain'], self.params['release'])
             elif name == 'decay':
@@ -38,25 +79,42 @@ class VoiceManager:
             elif name == 'resonance':
                 voice.filter.set_params(self.params['cutoff'], value)
 
+    def _is_slot_active(self, idx):
+        if self.bank is not None:
+            return self.bank.is_active(idx)
+        return self.voices[idx].is_active()
+
+    def active_count(self):
+        """Voices currently producing sound (including releasing ones)."""
+        if self.bank is not None:
+            return self.bank.active_count()
+        return sum(1 for voice in self.voices if voice.is_active())
+
+    def _slot_note_on(self, idx, frequency):
+        if self.bank is not None:
+            self.bank.note_on(idx, frequency)
+        else:
+            self.voices[idx].note_on(frequency)
+
     def note_on(self, frequency):
         # Check if note already playing
         if frequency in self.active_voices:
             idx = self.active_voices[frequency]
-            self.voices[idx].note_on(frequency) # Retrigger
+            self._slot_note_on(idx, frequency) # Retrigger
             return
 
         # Find free voice
-        for idx, voice in enumerate(self.voices):
-            if not voice.is_active():
+        for idx in range(self.max_voices):
+            if not self._is_slot_active(idx):
                 self.active_voices[frequency] = idx
-                
+
                 # Ensure params are fresh (though we update all on param change)
-                # But filter state resets? Maybe better not to reset filter to avoid pops? 
+                # But filter state resets? Maybe better not to reset filter to avoid pops?
                 # Voice logic keeps filter state persistence.
-                
-                voice.note_on(frequency)
+
+                self._slot_note_on(idx, frequency)
                 return
-        
+
         # No free voice: Voice stealing (steal oldest? or just ignore)
         # Simple implementation: Ignore
         print("Max polyphony reached!")
@@ -64,22 +122,33 @@ class VoiceManager:
     def note_off(self, frequency):
         if frequency in self.active_voices:
             idx = self.active_voices[frequency]
-            self.voices[idx].note_off()
+            if self.bank is not None:
+                self.bank.note_off(idx)
+            else:
+                self.voices[idx].note_off()
             # Don't remove from active_voices yet, wait for envelope to finish
             # We cleanup in process loop
             del self.active_voices[frequency]
 
     def process(self, num_samples):
-        output = np.zeros(num_samples)
-        
-        # Mix all voices
-        # We iterate over all voices because some might be releasing even if not in active_voices map
-        for voice in self.voices:
-            if voice.is_active():
-                output += voice.process(num_samples)
-        
+        if self.bank is not None:
+            # All active voices in one batched pass
+            output = self.bank.process(num_samples)
+        else:
+            if self._mix is not None and num_samples <= len(self._mix):
+                output = self._mix[:num_samples]
+                output.fill(0.0)
+            else:
+                output = np.zeros(num_samples)
+
+            # Mix all voices
+            # We iterate over all voices because some might be releasing even if not in active_voices map
+            for voice in self.voices:
+                if voice.is_active():
+                    output += voice.process(num_samples)
+
         # Soft Clipping / Limiting to prevent massive distortion
         np.clip(output, -2.0, 2.0, out=output)
-        output = np.tanh(output) # Soft clip
-        
+        np.tanh(output, out=output) # Soft clip
+
         return output
@@ -0,0 +1,107 @@
+import numpy as np
+
+TABLE_SIZE = 2048
+
+def _spectrum(waveform, num_harmonics):
+    """
+    rfft spectrum of one cycle of the waveform, truncated to num_harmonics.
+    Series are chosen to match the naive oscillators in oscillator.py
+    (same phase, polarity and range).
+    """
+    spectrum = np.zeros(TABLE_SIZE // 2 + 1, dtype=complex)
+    k = np.arange(1, num_harmonics + 1)
+    half = TABLE_SIZE / 2.0
+
+    if waveform == 'sine':
+        spectrum[1] = -1j * half
+    elif waveform == 'saw':
+        # 2t - 1 = -(2 / pi) * sum(sin(2 pi k t) / k)
+        spectrum[k] = 1j * (2.0 / (np.pi * k)) * half
+    elif waveform == 'square':
+        # +1 / -1 square = (4 / pi) * sum_odd(sin(2 pi k t) / k)
+        odd = k[k % 2 == 1]
+        spectrum[odd] = -1j * (4.0 / (np.pi * odd)) * half
+    elif waveform == 'triangle':
+        # 2|2t - 1| - 1 = (8 / pi^2) * sum_odd(cos(2 pi k t) / k^2)
+        odd = k[k % 2 == 1]
+        spectrum[odd] = (8.0 / (np.pi ** 2 * odd ** 2)) * half
+    else:
+        raise ValueError(f"Unknown waveform: {waveform}")
+
+    return spectrum
+
+class WavetableSet:
+    """
+    Per-octave band-limited tables for one waveform.
+    Level k holds only the harmonics that stay below Nyquist for every
+    fundamental up to base_freq * 2**k, so picking the level by note
+    frequency removes aliasing without oversampling.
+    """
+    def __init__(self, waveform, sample_rate=44100):
+        self.waveform = waveform
+        self.sample_rate = sample_rate
+        self.base_freq = sample_rate / TABLE_SIZE
+        nyquist = sample_rate / 2.0
+
+        self.num_levels = int(np.ceil(np.log2(nyquist / self.base_freq))) + 1
+
+        # One extra guard sample per table (copy of index 0) so interpolation never wraps
+        self.tables = np.zeros((self.num_levels, TABLE_SIZE + 1))
+        for level in range(self.num_levels):
+            max_freq = self.base_freq * (2 ** level)
+            num_harmonics = int(min(nyquist / max_freq, TABLE_SIZE // 2 - 1))
+            num_harmonics = max(1, num_harmonics)
+            table = np.fft.irfft(_spectrum(waveform, num_harmonics), TABLE_SIZE)
+            self.tables[level, :TABLE_SIZE] = table
+            self.tables[level, TABLE_SIZE] = table[0]
+
+        self._flat = self.tables.ravel()
+        # Per-sample slope (next - current) so interpolation needs only two gathers
+        self._slope = np.zeros_like(self._flat)
+        self._slope[:-1] = np.diff(self._flat)
+
+    def level_for(self, frequency):
+        """Mip level for a frequency (scalar or array)."""
+        ratio = np.maximum(np.asarray(frequency, dtype=float), self.base_freq) / self.base_freq
+        level = np.ceil(np.log2(ratio)).astype(int)
+        return np.clip(level, 0, self.num_levels - 1)
+
+    def render(self, phases, level, out=None, index=None):
+        """
+        Linear-interpolated table lookup.
+        phases: wrapped phases in [0.0, 1.0), any shape.
+        level: mip level, broadcastable against phases (e.g. (voices, 1) for a voice matrix).
+        out / index: optional float / intp scratch shaped like phases (real-time mode).
+            phases is overwritten in that case.
+        """
+        if out is None:
+            pos = phases * TABLE_SIZE
+            index = pos.astype(np.intp)
+            frac = pos - index
+            index += np.asarray(level, dtype=np.intp) * (TABLE_SIZE + 1)
+            return np.take(self._flat, index) + frac * np.take(self._slope, index)
+
+        # Same math without temporaries: modf splits the position into frac (in phases)
+        # and the integer part (in out, then copied to index)
+        frac = phases
+        frac *= TABLE_SIZE
+        np.modf(frac, out=(frac, out))
+        np.copyto(index, out, casting='unsafe')
+        index += level * (TABLE_SIZE + 1)
+
+        # mode='clip' lets take() write straight into out ('raise' always buffers)
+        np.take(self._slope, index, out=out, mode='clip')
+        out *= frac
+        out += np.take(self._flat, index, out=frac, mode='clip')
+        return out
+
+# Tables are built once per (waveform, sample_rate) and shared by every voice
+_wavetable_cache = {}
+
+def get_wavetable(waveform, sample_rate=44100):
+    key = (waveform, sample_rate)
+    table = _wavetable_cache.get(key)
+    if table is None:
+        table = WavetableSet(waveform, sample_rate)
+        _wavetable_cache[key] = table
+    return table
@@ -0,0 +1,46 @@
+from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QProgressBar
+from PySide6.QtCore import QTimer
+from ..audio.engine import AudioEngine
+
+class LoadMeter(QWidget):
+    """
+    Compact audio load display: smoothed callback CPU load (% of the block
+    deadline), peak, active voices/pods, deadline misses and xruns.
+    Polls AudioEngine.get_stats(); the tooltip shows the per-stage breakdown.
+    """
+    def __init__(self):
+        super().__init__()
+        self.engine = AudioEngine()
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(4, 0, 4, 0)
+        layout.setSpacing(8)
+
+        layout.addWidget(QLabel("DSP"))
+
+        self.load_bar = QProgressBar()
+        self.load_bar.setObjectName("loadMeter")
+        self.load_bar.setRange(0, 100)
+        self.load_bar.setFixedWidth(120)
+        self.load_bar.setFormat("%p%")
+        layout.addWidget(self.load_bar)
+
+        self.info_label = QLabel()
+        layout.addWidget(self.info_label)
+
+        # Update Timer (5 fps is plenty for a meter)
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.update_stats)
+        self.timer.start(200)
+
+    def update_stats(self):
+        stats = self.engine.get_stats()
+        self.load_bar.setValue(min(100, int(stats['cpu_load'])))
+        self.info_label.setText(
+            f"peak {stats['peak_load']:.0f}%  |  voices {stats['active_voices']}  |  pods {stats['active_pods']}"
+            f"  |  misses {stats['deadline_misses']}  |  xruns {stats['xruns']}"
+        )
+
+        lines = [f"{name}: {avg:.0f} us avg / {stats['stage_max_us'][name]:.0f} us max"
+                 for name, avg in stats['stage_avg_us'].items()]
+        self.setToolTip("\n".join(lines))
@@ -4,6 +4,7 @@ from .synth_panel import SynthPanel
 from .looper_panel import LooperPanel
 from .visualizer import Visualizer
 from .keyboard import VirtualKeyboard
+from .load_meter import LoadMeter
 from ..audio.engine import AudioEngine
 
 class MainApplication(QMainWindow):
@@ -53,6 +54,10 @@ class MainApplication(QMainWindow):
         self.keyboard.note_off_signal.connect(self.audio_engine.note_off)
         main_layout.addWidget(self.keyboard, stretch=1)
 
+        # Status Bar: DSP load meter
+        self.load_meter = LoadMeter()
+        self.statusBar().addPermanentWidget(self.load_meter)
+
     def keyPressEvent(self, event):
         # Forward to keyboard
         if not event.isAutoRepeat():
@@ -1,4 +1,4 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QComboBox, QGroupBox, QDial
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QComboBox, QGroupBox, QDial, QCheckBox
 from PySide6.QtCore import Qt
 from ..audio.engine import AudioEngine
 
@@ -17,8 +17,14 @@ class SynthPanel(QWidget):
         self.osc_combo.addItems(["saw", "sine", "square", "triangle"])
         self.osc_combo.currentTextChanged.connect(lambda t: self.engine.set_synth_param('osc_type', t))
         
+        self.bandlimited_check = QCheckBox("Band-limited")
+        self.bandlimited_check.setToolTip("Mipmapped wavetables (no aliasing on high notes)")
+        self.bandlimited_check.setChecked(True)
+        self.bandlimited_check.toggled.connect(lambda c: self.engine.set_synth_param('bandlimited', c))
+        
         osc_layout.addWidget(QLabel("Waveform"))
         osc_layout.addWidget(self.osc_combo)
+        osc_layout.addWidget(self.bandlimited_check)
         main_layout.addWidget(osc_group)
         
         # Filter Section
@@ -0,0 +1,21 @@
+import pytest
+import sys
+import os
+
+# Add benchmarks to path (bench_dsp adds src itself)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+import bench_dsp
+
+def test_benchmark_cases_run_and_report():
+    results = bench_dsp.run(('voice_manager', 'looper'), iterations=3, warmup=1, pattern='block=256')
+    assert results
+    for name, stats in results.items():
+        assert 'block=256' in name
+        assert stats['p50_us'] <= stats['max_us']
+        assert stats['rtf'] > 0.0
+
+def test_compare_flags_regressions_over_threshold():
+    baseline = {'a': {'mean_us': 100.0}, 'b': {'mean_us': 100.0}}
+    results = {'a': {'mean_us': 110.0}, 'b': {'mean_us': 130.0}, 'new': {'mean_us': 1.0}}
+    assert bench_dsp.compare(results, baseline, threshold=0.15) == ['b']
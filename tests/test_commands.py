@@ -0,0 +1,92 @@
+import pytest
+import numpy as np
+import sys
+import os
+from unittest.mock import MagicMock
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Mock sounddevice BEFORE importing AudioEngine
+sys.modules['sounddevice'] = MagicMock()
+
+from audio import commands
+from audio.commands import CommandQueue
+from audio.engine import AudioEngine
+
+def test_queue_preserves_order_and_wraps():
+    queue = CommandQueue(capacity=4)
+    seen = []
+    for round_ in range(3):
+        for i in range(3):
+            assert queue.push(commands.NOTE_ON, round_ * 10 + i)
+        queue.drain(lambda op, target, value: seen.append(target))
+    assert seen == [0, 1, 2, 10, 11, 12, 20, 21, 22]
+    assert queue.pending() == 0
+
+def test_queue_is_bounded():
+    queue = CommandQueue(capacity=2)
+    assert queue.push(commands.NOTE_ON, 1)
+    assert queue.push(commands.NOTE_ON, 2)
+    assert not queue.push(commands.NOTE_ON, 3)
+    assert queue.dropped == 1
+    assert queue.pending() == 2
+
+def test_engine_applies_commands_on_audio_thread():
+    engine = AudioEngine(sample_rate=44100, block_size=1024)
+    engine.voice_manager.active_voices.clear()
+    outdata = np.zeros((engine.block_size, 1))
+
+    engine.is_running = True # Pretend a stream is draining the queue
+    try:
+        now = engine.sample_clock
+        engine.note_on(440.0, sample_time=now)
+        engine.set_synth_param('cutoff', 1500.0, sample_time=now)
+        # Nothing touched from the calling thread yet
+        assert 440.0 not in engine.voice_manager.active_voices
+        assert engine.commands.pending() == 2
+
+        engine._callback(outdata, engine.block_size, None, None)
+        assert 440.0 in engine.voice_manager.active_voices
+        assert engine.voice_manager.params['cutoff'] == 1500.0
+        assert engine.commands.pending() == 0
+
+        engine.note_off(440.0, sample_time=engine.sample_clock)
+        engine._callback(outdata, engine.block_size, None, None)
+        assert 440.0 not in engine.voice_manager.active_voices
+    finally:
+        engine.is_running = False
+        engine.set_synth_param('cutoff', 2000.0)
+        # Let the released voice finish so other engine tests start silent
+        while engine.voice_manager.bank.active_count():
+            engine.voice_manager.process(engine.block_size)
+
+def test_events_land_on_exact_sample():
+    engine = AudioEngine(sample_rate=44100, block_size=1024)
+    engine.voice_manager.active_voices.clear()
+    outdata = np.zeros((engine.block_size, 1))
+
+    engine.is_running = True
+    try:
+        # Scheduled inside the second block: first block stays silent
+        start = engine.sample_clock + engine.block_size + 300
+        engine.note_on(440.0, sample_time=start)
+        engine._callback(outdata, engine.block_size, None, None)
+        assert np.allclose(outdata, 0.0)
+        assert engine.commands.pending() == 1
+
+        engine._callback(outdata, engine.block_size, None, None)
+        block = outdata[:, 0]
+        assert np.allclose(block[:301], 0.0) # First sample of a note is 0 (attack starts at 0)
+        assert np.all(block[301:320] != 0.0)
+        assert engine.commands.pending() == 0
+
+        # Default stamps are one block ahead of the estimated clock
+        stamp_before = engine.now_samples() + engine.block_size
+        engine.note_off(440.0)
+        assert engine.commands.peek_time() >= stamp_before
+    finally:
+        engine.is_running = False
+        engine.commands.drain(engine._apply)
+        while engine.voice_manager.bank.active_count():
+            engine.voice_manager.process(engine.block_size)
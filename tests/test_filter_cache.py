@@ -0,0 +1,91 @@
+import pytest
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from audio.filter import FilterCoefficientCache
+from audio.voice_manager import VoiceManager
+
+def test_voices_share_coefficient_arrays():
+    vm = VoiceManager(44100, max_voices=4, vectorized=False)
+    vm.set_param('cutoff', 1234.0)
+    first = vm.voices[0].filter
+    for voice in vm.voices[1:]:
+        assert voice.filter.b is first.b
+        assert voice.filter.a is first.a
+    assert not first.b.flags.writeable
+
+def test_quantized_cutoffs_hit_cache():
+    cache = FilterCoefficientCache(steps_per_octave=24)
+    b1, a1 = cache.get('lowpass', 1000.0, 0.7, 44100)
+    b2, a2 = cache.get('lowpass', 1001.0, 0.5, 44100) # Same step, butterworth ignores Q
+    assert b1 is b2 and a1 is a2
+    assert cache.misses == 1 and cache.hits == 1
+
+    # Resonant (cheby1) designs are keyed separately
+    b3, _ = cache.get('lowpass', 1000.0, 3.0, 44100)
+    assert b3 is not b1
+
+def test_lru_eviction():
+    cache = FilterCoefficientCache(max_entries=3)
+    for cutoff in (100.0, 200.0, 400.0):
+        cache.get('lowpass', cutoff, 0.7, 44100)
+    cache.get('lowpass', 100.0, 0.7, 44100) # 100 becomes most recent
+    cache.get('lowpass', 800.0, 0.7, 44100) # Evicts 200
+    assert len(cache._entries) == 3
+    misses = cache.misses
+    cache.get('lowpass', 100.0, 0.7, 44100)
+    assert cache.misses == misses
+    cache.get('lowpass', 200.0, 0.7, 44100)
+    assert cache.misses == misses + 1
+
+def test_precomputed_table_is_pinned():
+    cache = FilterCoefficientCache(max_entries=2, steps_per_octave=12)
+    cache.precompute('lowpass', 44100, cutoff_range=(20.0, 10000.0))
+    misses = cache.misses
+    for cutoff in np.geomspace(20.0, 10000.0, 50):
+        cache.get('lowpass', cutoff, 0.7, 44100)
+    assert cache.misses == misses
+
+def test_batch_filter_matches_per_voice_filters():
+    from audio.filter import Filter, BatchFilter
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((3, 2048))
+
+    batch = BatchFilter(44100, max_voices=4)
+    batch.set_params(1500.0, 0.7, immediate=True)
+    slots = np.array([0, 2, 3])
+    out = np.concatenate([batch.process(data[:, :1024], slots), batch.process(data[:, 1024:], slots)], axis=1)
+
+    for row in range(3):
+        f = Filter(44100)
+        f.set_params(1500.0, 0.7)
+        f.zi = np.zeros_like(f.zi)
+        ref = np.concatenate([f.process(data[row, :1024]), f.process(data[row, 1024:])])
+        assert np.allclose(out[row], ref, atol=1e-9)
+
+    # Untouched slot keeps a zero state
+    assert np.all(batch.zi[:, 1, :] == 0.0)
+
+def test_batch_filter_glides_without_reset():
+    from audio.filter import BatchFilter
+    slots = np.array([0])
+    dc = np.ones((1, 4096))
+
+    def sweep_error(immediate):
+        batch = BatchFilter(44100, max_voices=1)
+        batch.set_params(200.0, 0.7, immediate=True)
+        batch.process(dc, slots) # Settle on DC
+        batch.set_params(8000.0, 0.7, immediate=immediate)
+        out = batch.process(dc, slots)[0]
+        assert batch.cutoff == batch.target_cutoff
+        return np.max(np.abs(out - 1.0))
+
+    # Lowpass on DC should stay near 1.0 through the sweep: state carried over,
+    # and the glide keeps the transient far below an instant coefficient switch
+    glide = sweep_error(immediate=False)
+    assert glide < 0.1
+    assert glide < sweep_error(immediate=True) / 5
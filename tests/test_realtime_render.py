@@ -0,0 +1,44 @@
+import pytest
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from audio.voice_manager import VoiceManager
+from audio.looper import Looper, PodState
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_prepared_voice_manager_reuses_buffers(vectorized):
+    prepared = VoiceManager(44100, max_voices=4, vectorized=vectorized)
+    reference = VoiceManager(44100, max_voices=4, vectorized=vectorized)
+    prepared.prepare(512)
+    for vm in (prepared, reference):
+        vm.note_on(220.0)
+        vm.note_on(330.0)
+
+    first = prepared.process(512)
+    expected = reference.process(512)
+    assert np.allclose(first, expected)
+
+    second = prepared.process(512)
+    expected = reference.process(512)
+    assert np.shares_memory(first, second) # Same scratch block, no new output array
+    assert np.allclose(second, expected)
+
+    # Larger blocks than prepared still work (fall back to allocation)
+    assert np.allclose(prepared.process(1024), reference.process(1024))
+
+def test_prepared_looper_reuses_mix_bus():
+    looper = Looper(44100)
+    looper.prepare(256)
+    pod = looper.pods[0]
+    pod.buffer = np.full(1000, 0.25)
+    pod.state = PodState.PLAYING
+
+    first = looper.process(np.zeros(256), 256)
+    assert np.allclose(first, 0.25)
+    second = looper.process(np.zeros(256), 256)
+    assert np.shares_memory(first, second)
+    assert np.allclose(second, 0.25)
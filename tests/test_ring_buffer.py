@@ -0,0 +1,45 @@
+import pytest
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from audio.ring_buffer import RingBuffer
+
+def test_latest_window_across_wrap():
+    ring = RingBuffer(100)
+    data = np.arange(350, dtype=float)
+    for start in range(0, 350, 30):
+        ring.write(data[start:start + 30])
+
+    assert ring.write_count == 350
+    assert np.array_equal(ring.latest(100), data[-100:])
+    assert np.array_equal(ring.latest(7), data[-7:])
+
+def test_window_is_zero_copy_view():
+    ring = RingBuffer(64)
+    ring.write(np.ones(80))
+    view = ring.latest(50)
+    assert np.shares_memory(view, ring._data)
+    assert view.flags['C_CONTIGUOUS']
+
+def test_window_by_absolute_position():
+    ring = RingBuffer(100)
+    data = np.arange(250, dtype=float)
+    ring.write(data[:120])
+    ring.write(data[120:250])
+    assert np.array_equal(ring.window(200, 40), data[160:200])
+    # Older than the history: clamped to what is still stored
+    assert np.array_equal(ring.window(160, 40), data[150:160])
+
+def test_short_history_and_oversized_block():
+    ring = RingBuffer(16)
+    ring.write(np.arange(5, dtype=float))
+    assert np.array_equal(ring.latest(10), np.arange(5))
+
+    big = np.arange(40, dtype=float)
+    ring.write(big)
+    assert ring.write_count == 45
+    assert np.array_equal(ring.latest(16), big[-16:])
@@ -0,0 +1,57 @@
+import pytest
+import numpy as np
+import sys
+import os
+from unittest.mock import MagicMock
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Mock sounddevice BEFORE importing AudioEngine
+sys.modules['sounddevice'] = MagicMock()
+
+from audio.telemetry import CallbackTelemetry, STAGE_VOICES
+from audio.engine import AudioEngine
+
+def test_telemetry_counts_misses_and_xruns():
+    stats = CallbackTelemetry(sample_rate=1000)
+    # 10 frames at 1 kHz = 10 ms deadline
+    started = stats.begin_block()
+    stats.add_stage(STAGE_VOICES, started)
+    stats.end_block(10, active_voices=3, active_pods=1)
+
+    stats.begin_block(status="output underflow")
+    stats._block_start -= 0.02 # Pretend the block took 20 ms (200% load)
+    stats.end_block(10)
+
+    snapshot = stats.stats()
+    assert snapshot['blocks'] == 2
+    assert snapshot['xruns'] == 1
+    assert snapshot['deadline_misses'] == 1
+    assert snapshot['peak_load'] >= 200.0
+    assert snapshot['histogram'].sum() == 2
+    assert snapshot['histogram'][-1] == 1
+    assert snapshot['stage_max_us']['voices'] >= 0.0
+
+def test_engine_reports_callback_stats():
+    engine = AudioEngine(sample_rate=44100, block_size=1024)
+    for freq in list(engine.voice_manager.active_voices):
+        engine.voice_manager.note_off(freq)
+    while engine.voice_manager.active_count(): # Let voices from other tests finish
+        engine.voice_manager.process(engine.block_size)
+    engine.telemetry.reset()
+    outdata = np.zeros((engine.block_size, 1))
+
+    engine.voice_manager.note_on(440.0)
+    for _ in range(3):
+        engine._callback(outdata, engine.block_size, None, None)
+
+    stats = engine.get_stats()
+    assert stats['blocks'] == 3
+    assert stats['active_voices'] == 1
+    assert stats['stage_avg_us']['voices'] > 0.0
+    assert stats['cpu_load'] > 0.0
+
+    engine.voice_manager.note_off(440.0)
+    while engine.voice_manager.active_count():
+        engine.voice_manager.process(engine.block_size)
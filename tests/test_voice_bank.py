@@ -0,0 +1,70 @@
+import pytest
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from audio.envelope import ADSREnvelope, EnvelopeState
+from audio.voice_bank import VoiceBank
+from audio.voice_manager import VoiceManager
+
+def test_bank_envelope_matches_scalar_envelope():
+    env = ADSREnvelope(44100)
+    env.set_params(0.01, 0.02, 0.5, 0.01)
+    bank = VoiceBank(44100, max_voices=1)
+    bank.set_envelope(0.01, 0.02, 0.5, 0.01)
+
+    env.trigger()
+    bank.note_on(0, 440.0)
+    slot = np.array([0])
+
+    # Attack -> Decay -> Sustain across block boundaries
+    for _ in range(4):
+        expected = env.get_amplitude(300)
+        got = bank._render_envelopes(slot, 300)[0]
+        assert np.allclose(got, expected)
+        assert bank.stage[0] == env.state.value
+
+    # Release -> Idle
+    env.release()
+    bank.note_off(0)
+    while bank.is_active(0):
+        expected = env.get_amplitude(300)
+        got = bank._render_envelopes(slot, 300)[0]
+        assert np.allclose(got, expected)
+        assert bank.stage[0] == env.state.value
+
+    assert env.state == EnvelopeState.IDLE
+
+def test_bank_voices_finish_and_free_slots():
+    vm = VoiceManager(44100, max_voices=2)
+    vm.set_param('release', 0.01)
+    vm.note_on(440)
+    vm.note_on(880)
+    out = vm.process(1024)
+    assert np.max(np.abs(out)) > 0.0
+    assert vm.bank.active_count() == 2
+
+    vm.note_off(440)
+    vm.note_off(880)
+    for _ in range(5):
+        vm.process(1024)
+    assert vm.bank.active_count() == 0
+    assert np.allclose(vm.process(256), 0.0)
+
+def test_bank_and_reference_path_agree():
+    bank_vm = VoiceManager(44100, max_voices=4)
+    ref_vm = VoiceManager(44100, max_voices=4, vectorized=False)
+    for vm in (bank_vm, ref_vm):
+        vm.set_param('cutoff', 3000.0)
+        if vm.bank is not None:
+            vm.bank.set_filter(3000.0, 0.7, immediate=True) # Skip the glide for comparison
+        for voice in vm.voices:
+            voice.filter.zi = np.zeros_like(voice.filter.zi)
+        vm.note_on(261.63)
+        vm.note_on(329.63)
+
+    for _ in range(3):
+        assert np.allclose(bank_vm.process(512), ref_vm.process(512), atol=1e-9)
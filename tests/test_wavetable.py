@@ -0,0 +1,38 @@
+import pytest
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from audio.oscillator import SawOsc, SquareOsc, WavetableOsc
+from audio.wavetable import get_wavetable
+
+def _alias_ratio(samples, frequency, sample_rate=44100):
+    """Fraction of spectral energy that is not on a harmonic of frequency."""
+    window = np.hanning(len(samples))
+    spectrum = np.abs(np.fft.rfft(samples * window)) ** 2
+    freqs = np.fft.rfftfreq(len(samples), 1 / sample_rate)
+    harmonic = np.abs(freqs / frequency - np.round(freqs / frequency)) * frequency < 15.0
+    return spectrum[~harmonic].sum() / spectrum.sum()
+
+def test_tables_are_shared():
+    assert get_wavetable('saw', 44100) is get_wavetable('saw', 44100)
+    osc_a = WavetableOsc(44100, 'saw')
+    osc_b = WavetableOsc(44100, 'saw')
+    assert osc_a.table is osc_b.table
+
+def test_low_note_matches_naive_waveform():
+    # Full-band table at low pitch should look like the naive waveform
+    naive = SawOsc(44100).get_samples(4096, 55.0)
+    table = WavetableOsc(44100, 'saw').get_samples(4096, 55.0)
+    assert np.mean(np.abs(naive - table)) < 0.02
+
+@pytest.mark.parametrize("naive_cls,waveform", [(SawOsc, 'saw'), (SquareOsc, 'square')])
+def test_high_note_has_no_aliasing(naive_cls, waveform):
+    freq = 3520.0
+    naive = naive_cls(44100).get_samples(8192, freq)
+    table = WavetableOsc(44100, waveform).get_samples(8192, freq)
+    assert _alias_ratio(table, freq) < 1e-4
+    assert _alias_ratio(table, freq) < _alias_ratio(naive, freq) / 100